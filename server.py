@@ -1,16 +1,37 @@
 #!/usr/bin/env python3
 """MCP Mode Switcher - Switch between different MCP configuration profiles."""
 
+import functools
+import heapq
+import io
 import json
 import logging
+import os
+import shutil
 import signal
-import subprocess
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from types import MappingProxyType
 
 from fastmcp import FastMCP
 
+# Prefer orjson for config parsing/serializing; fall back to the stdlib codec
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 # Set up file logging for crash diagnosis
 LOG_DIR = Path.home() / "Library" / "Logs" / "mcp-mode-switcher"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -55,16 +76,88 @@ CONFIGS_DIR = CLAUDE_CONFIG_DIR / "configs"
 MODES_FILE = CONFIGS_DIR / "modes.json"
 BACKUPS_DIR = CLAUDE_CONFIG_DIR / "backups"
 
+# Parsed modes.json, reused until the file's (mtime, size) changes
+_modes_cache = {"key": None, "value": None}
+
+# Stat results younger than this are trusted without re-checking the file,
+# so a burst of tool calls doesn't stat the same configs over and over
+_FRESH_WINDOW_S = 0.25
+_stat_cache: dict[str, tuple[float, os.stat_result]] = {}
+
+# Tool output templates, filled in with str.format_map
+_SWITCH_WARN_TMPL = """⚠️ **WARNING: This action will restart Claude Desktop!**
+
+You are about to switch to **{mode}** mode:
+- {description}
+- Estimated token cost: {token_cost}
+
+**This will:**
+1. Replace your current claude_desktop_config.json
+2. Quit Claude Desktop
+3. Reopen Claude Desktop
+
+**You will lose this conversation!**
+
+To proceed, call `switch_mode(mode="{mode}", confirm=True)`"""
+
+_SWITCH_OK_TMPL = """✓ Switching to **{mode}** mode...
+
+{backup_msg}
+Config file updated. Claude Desktop is restarting.
+
+(This message may not be visible as the app is restarting)"""
+
+_SAVE_OK_TMPL = """✓ Saved current config as **{name}** mode!
+
+**Description**: {description}
+**Token cost**: {token_cost}
+**MCPs**: {mcps}
+**Config file**: `{config_file}`
+
+You can now switch to this mode anytime with `switch_mode("{name}")`"""
+
+
+def _load_json_strict(path: Path) -> dict | None:
+    """Load a JSON file, letting FileNotFoundError and JSONDecodeError propagate.
+
+    An empty file is treated as having no contents and returns None.
+    """
+    data = path.read_bytes()
+    return _json_loads(data) if data else None
+
+
+def _cached_stat(path: Path) -> os.stat_result:
+    """os.stat() a path, reusing the result for up to _FRESH_WINDOW_S seconds.
+
+    Raises OSError like os.stat(); failures are not cached.
+    """
+    key = str(path)
+    now = time.monotonic()
+    hit = _stat_cache.get(key)
+    if hit is not None and now - hit[0] < _FRESH_WINDOW_S:
+        return hit[1]
+    st = os.stat(key)
+    # Entries past the window are never served again, so drop them here to keep
+    # deleted or renamed profiles from accumulating
+    for stale in [k for k, (checked, _) in _stat_cache.items() if now - checked >= _FRESH_WINDOW_S]:
+        del _stat_cache[stale]
+    _stat_cache[key] = (now, st)
+    return st
+
+
+def _forget_stat(path: Path) -> None:
+    """Drop any cached stat for a path this process has just written."""
+    _stat_cache.pop(str(path), None)
+
 
 def load_json_file(path: Path) -> dict | None:
-    """Load a JSON file and return its contents."""
+    """Load a JSON file and return its contents, or None if it is missing or invalid."""
     try:
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json_strict(path)
     except FileNotFoundError:
         logger.debug(f"File not found: {path}")
         return None
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         logger.warning(f"JSON decode error in {path}: {e}")
         return None
     except Exception as e:
@@ -72,6 +165,69 @@ def load_json_file(path: Path) -> dict | None:
         return None
 
 
+@functools.lru_cache(maxsize=32)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int) -> MappingProxyType | None:
+    """Load a JSON object file, memoized on its path, mtime and size.
+
+    The cache is bounded so long-lived sessions don't accumulate stale
+    entries. Results are shared between calls: the top level is a
+    read-only view, but nested values (e.g. "mcpServers") are the cached
+    objects themselves and must not be mutated.
+
+    Invalid content is cached as None, but OSError (e.g. a permission
+    problem that a chmod may fix without touching mtime) propagates so the
+    failure isn't memoized.
+    """
+    try:
+        data = _load_json_strict(Path(path_str))
+    except ValueError as e:
+        logger.warning(f"JSON decode error in {path_str}: {e}")
+        return None
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        logger.warning(f"Expected a JSON object in {path_str}")
+        return None
+    return MappingProxyType(data)
+
+
+def _stat_and_load(path: Path) -> tuple[bool, int | None, MappingProxyType | None]:
+    """Stat a JSON file once and load it through the mtime-keyed cache.
+
+    Returns (exists, mtime_ns, config). config is None if the file is
+    missing or invalid.
+    """
+    try:
+        st = _cached_stat(path)
+    except FileNotFoundError:
+        return False, None, None
+    except OSError as e:
+        logger.error(f"Could not stat {path}: {e}")
+        return False, None, None
+    try:
+        config = _read_json_cached(str(path), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return False, None, None
+    except OSError as e:
+        logger.error(f"Could not read {path}: {e}")
+        return True, st.st_mtime_ns, None
+    return True, st.st_mtime_ns, config
+
+
+@functools.lru_cache(maxsize=64)
+def _servers_frozenset(path_str: str, mtime_ns: int, size: int) -> tuple[frozenset[str], str] | None:
+    """Return a config's MCP server names and their sorted display string.
+
+    Memoized on path, mtime and size. Returns None if the config is invalid;
+    OSError propagates uncached, as in _read_json_cached.
+    """
+    config = _read_json_cached(path_str, mtime_ns, size)
+    if config is None:
+        return None
+    servers = frozenset(config.get("mcpServers", {}))
+    return servers, ", ".join(sorted(servers))
+
+
 def get_modes() -> dict:
     """Load modes from modes.json or auto-discover from config files.
 
@@ -80,35 +236,91 @@ def get_modes() -> dict:
         "full": {"description": "...", "token_cost": "..."},
         "minimal": {"description": "...", "token_cost": "..."}
     }
+
+    Auto-discovered modes also carry a "_servers" list of the MCP names
+    in their config, so callers don't need to parse it again.
+
+    The returned dict is a fresh copy that callers may add modes to, but the
+    per-mode dicts are shared with the cache and must not be mutated.
     """
-    # Try to load from modes.json first
-    modes_data = load_json_file(MODES_FILE)
-    if modes_data:
-        return modes_data
+    # Try to load from modes.json first, skipping the parse if it hasn't changed.
+    # Only a missing file falls back to auto-discovery; an unreadable or corrupt
+    # one is an error so the user's curated descriptions aren't silently replaced.
+    try:
+        st = _cached_stat(MODES_FILE)
+    except (FileNotFoundError, NotADirectoryError):
+        # NotADirectoryError: configs/ is a file, so there can be no modes.json
+        st = None
+    except OSError as e:
+        logger.error(f"Could not stat {MODES_FILE}: {e}")
+        raise ValueError(f"{MODES_FILE} could not be read ({e}). Fix or remove it.") from e
+
+    if st is not None:
+        cache_key = (st.st_mtime_ns, st.st_size)
+        if _modes_cache["key"] == cache_key:
+            return dict(_modes_cache["value"])
+
+        try:
+            modes_data = _load_json_strict(MODES_FILE)
+        except FileNotFoundError:
+            modes_data = None
+        except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError from stdlib json
+            logger.error(f"JSON decode error in {MODES_FILE}: {e}")
+            raise ValueError(f"{MODES_FILE} is not valid JSON ({e}). Fix or remove it.") from e
+        except OSError as e:
+            logger.error(f"Could not read {MODES_FILE}: {e}")
+            raise ValueError(f"{MODES_FILE} could not be read ({e}). Fix or remove it.") from e
+
+        if modes_data:
+            _modes_cache["key"] = cache_key
+            _modes_cache["value"] = modes_data
+            return dict(modes_data)
 
     # Fallback: auto-discover from configs/*.json files
     modes = {}
-    if CONFIGS_DIR.exists():
-        for config_file in CONFIGS_DIR.glob("*.json"):
-            if config_file.name == "modes.json":
-                continue
-
-            mode_name = config_file.stem
-            config = load_json_file(config_file)
-            if config and "mcpServers" in config:
-                # Auto-generate description from MCP names
-                mcps = [k for k in config["mcpServers"].keys() if k != "mcp-mode-switcher"]
-                description = f"MCPs: {', '.join(mcps)}" if mcps else "No MCPs"
-                modes[mode_name] = {
-                    "description": description,
-                    "token_cost": "unknown"
-                }
+    try:
+        with os.scandir(CONFIGS_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".json") or name == "modes.json":
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                mode_name = name[:-5]
+                try:
+                    config = _read_json_cached(entry.path, st.st_mtime_ns, st.st_size)
+                except OSError as e:
+                    logger.error(f"Could not read {entry.path}: {e}")
+                    continue
+                if config and "mcpServers" in config:
+                    # Auto-generate description from MCP names
+                    servers = list(config["mcpServers"])
+                    mcps_str = ", ".join(k for k in servers if k != "mcp-mode-switcher")
+                    description = f"MCPs: {mcps_str}" if mcps_str else "No MCPs"
+                    modes[mode_name] = {
+                        "description": description,
+                        "token_cost": "unknown",
+                        "_servers": servers
+                    }
+    except FileNotFoundError:
+        logger.debug(f"Configs directory not found: {CONFIGS_DIR}")
+    except OSError as e:
+        logger.warning(f"Could not read configs directory {CONFIGS_DIR}: {e}")
 
     return modes
 
 
+@functools.lru_cache(maxsize=64)
 def get_mode_config_path(mode_name: str) -> Path:
-    """Get the config file path for a mode."""
+    """Get the config file path for a mode.
+
+    CONFIGS_DIR is fixed for the life of the process, so the result is memoized.
+    """
     return CONFIGS_DIR / f"{mode_name}.json"
 
 
@@ -116,8 +328,8 @@ def save_json_file(path: Path, data: dict) -> bool:
     """Save a dict to a JSON file. Returns True on success."""
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        path.write_bytes(_json_dumps(data))
+        _forget_stat(path)
         logger.debug(f"Saved JSON to {path}")
         return True
     except PermissionError as e:
@@ -136,21 +348,33 @@ def create_backup() -> str | None:
 
     Returns the backup filename on success, None on failure.
     """
-    current_config = load_json_file(CLAUDE_CONFIG_FILE)
-    if current_config is None:
-        return None
+    from datetime import datetime  # deferred to keep server startup fast
 
-    BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-    backup_file = BACKUPS_DIR / f"config.{timestamp}.json"
+    if not CLAUDE_CONFIG_FILE.exists():
+        return None
 
-    if save_json_file(backup_file, current_config):
+    try:
+        BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        backup_file = BACKUPS_DIR / f"config.{timestamp}.json"
+        # Plain byte copy - no need to parse and re-serialize the config
+        shutil.copyfile(CLAUDE_CONFIG_FILE, backup_file)
+        logger.debug(f"Backed up config to {backup_file}")
         return backup_file.name
-    return None
+    except OSError as e:
+        logger.error(f"Failed to create backup: {e}")
+        return None
 
 
 def save_modes(modes: dict) -> bool:
     """Save modes metadata to modes.json."""
+    _modes_cache["key"] = None
+    _modes_cache["value"] = None
+    # Drop the runtime-only "_servers" list added by auto-discovery
+    modes = {
+        name: {k: v for k, v in info.items() if k != "_servers"}
+        for name, info in modes.items()
+    }
     return save_json_file(MODES_FILE, modes)
 
 
@@ -171,26 +395,36 @@ def list_modes() -> str:
     if not modes:
         return "No modes found. Config profiles should be in:\n" + str(CONFIGS_DIR)
 
-    result = ["# Available MCP Modes\n"]
-    result.append("(mcp-mode-switcher is included in all modes, adding ~2k tokens)\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Available MCP Modes\n")
+    w("\n(mcp-mode-switcher is included in all modes, adding ~2k tokens)\n")
 
     for mode_name, mode_info in modes.items():
         config_path = get_mode_config_path(mode_name)
-        exists = config_path.exists()
+        servers = mode_info.get("_servers")
+        if servers is not None:
+            # Auto-discovered modes already carry their servers; only check existence
+            try:
+                _cached_stat(config_path)
+                exists = True
+            except OSError:
+                exists = False
+        else:
+            exists, _, config = _stat_and_load(config_path)
+            if config:
+                servers = config.get("mcpServers", {})
         status = "✓" if exists else "✗ (config file missing)"
 
-        result.append(f"\n## {mode_name} {status}")
-        result.append(f"- **Description**: {mode_info.get('description', 'No description')}")
-        result.append(f"- **Token cost**: {mode_info.get('token_cost', 'unknown')}")
+        w(f"\n\n## {mode_name} {status}")
+        w(f"\n- **Description**: {mode_info.get('description', 'No description')}")
+        w(f"\n- **Token cost**: {mode_info.get('token_cost', 'unknown')}")
 
-        if exists:
-            config = load_json_file(config_path)
-            if config:
-                servers = list(config.get("mcpServers", {}).keys())
-                servers_str = ", ".join(servers)
-                result.append(f"- **MCPs**: {servers_str}")
+        if exists and servers is not None:
+            servers_str = ", ".join(servers)
+            w(f"\n- **MCPs**: {servers_str}")
 
-    return "\n".join(result)
+    return buf.getvalue()
 
 
 @mcp.tool()
@@ -206,35 +440,53 @@ def current_mode() -> str:
     - Error message if config cannot be read
     """
     logger.info("Tool called: current_mode()")
-    current_config = load_json_file(CLAUDE_CONFIG_FILE)
+    try:
+        st = _cached_stat(CLAUDE_CONFIG_FILE)
+        current = _servers_frozenset(str(CLAUDE_CONFIG_FILE), st.st_mtime_ns, st.st_size)
+    except OSError as e:
+        logger.error(f"Could not read {CLAUDE_CONFIG_FILE}: {e}")
+        current = None
 
-    if current_config is None:
+    if current is None:
         return "Error: Could not read current Claude Desktop config"
 
-    current_servers = set(current_config.get("mcpServers", {}).keys())
+    current_servers, current_servers_str = current
 
-    result = ["# Current MCP Configuration\n"]
-    result.append(f"**Active MCPs**: {', '.join(sorted(current_servers))}\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Current MCP Configuration\n")
+    w(f"\n**Active MCPs**: {current_servers_str}\n")
 
-    # Check against each profile
+    # Check against each profile using its cached server set, skipping
+    # profiles whose server count already rules out a match
+    current_len = len(current_servers)
     modes = get_modes()
     for mode_name, mode_info in modes.items():
         config_path = get_mode_config_path(mode_name)
-        profile_config = load_json_file(config_path)
+        try:
+            st = _cached_stat(config_path)
+            profile = _servers_frozenset(str(config_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+
+        if profile is None:
+            continue
 
-        if profile_config:
-            profile_servers = set(profile_config.get("mcpServers", {}).keys())
-            if current_servers == profile_servers:
-                result.append(f"**Current mode**: `{mode_name}`")
-                result.append(f"**Description**: {mode_info.get('description', 'No description')}")
-                result.append(f"**Token cost**: {mode_info.get('token_cost', 'unknown')}")
-                return "\n".join(result)
+        profile_servers = profile[0]
+        if len(profile_servers) != current_len:
+            continue
+
+        if current_servers == profile_servers:
+            w(f"\n**Current mode**: `{mode_name}`")
+            w(f"\n**Description**: {mode_info.get('description', 'No description')}")
+            w(f"\n**Token cost**: {mode_info.get('token_cost', 'unknown')}")
+            return buf.getvalue()
 
     # No match found
-    result.append("**Current mode**: `custom` (does not match any predefined profile)")
-    result.append("\nTo see available profiles, use `list_modes()`")
+    w("\n**Current mode**: `custom` (does not match any predefined profile)")
+    w("\n\nTo see available profiles, use `list_modes()`")
 
-    return "\n".join(result)
+    return buf.getvalue()
 
 
 @mcp.tool()
@@ -261,7 +513,7 @@ def switch_mode(mode: str, confirm: bool = False) -> str:
 
     # Validate mode
     if mode not in modes:
-        available = ", ".join(modes.keys()) if modes else "none"
+        available = ", ".join(modes) if modes else "none"
         return f"Error: Unknown mode '{mode}'. Available modes: {available}"
 
     mode_info = modes[mode]
@@ -273,37 +525,47 @@ def switch_mode(mode: str, confirm: bool = False) -> str:
 
     # If not confirmed, return warning
     if not confirm:
-        return f"""⚠️ **WARNING: This action will restart Claude Desktop!**
-
-You are about to switch to **{mode}** mode:
-- {mode_info.get('description', 'No description')}
-- Estimated token cost: {mode_info.get('token_cost', 'unknown')}
-
-**This will:**
-1. Replace your current claude_desktop_config.json
-2. Quit Claude Desktop
-3. Reopen Claude Desktop
-
-**You will lose this conversation!**
-
-To proceed, call `switch_mode(mode="{mode}", confirm=True)`"""
+        return _SWITCH_WARN_TMPL.format_map({
+            "mode": mode,
+            "description": mode_info.get("description", "No description"),
+            "token_cost": mode_info.get("token_cost", "unknown"),
+        })
 
     # Confirmed - perform the switch
+    import subprocess  # deferred to keep server startup fast
+
     logger.info(f"Tool called: switch_mode(mode={mode}, confirm=True)")
     try:
         # Create backup before switching
         backup_name = create_backup()
         logger.info(f"Backup created: {backup_name}")
 
-        # Read the new config
-        new_config = load_json_file(config_path)
-        if new_config is None:
+        # Read the profile once and validate those exact bytes, so what gets
+        # written is what was checked (no cache, no second read)
+        try:
+            new_bytes = config_path.read_bytes()
+            new_config = _json_loads(new_bytes) if new_bytes else None
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read config file {config_path}: {e}")
+            new_config = None
+        if not isinstance(new_config, dict):
             logger.error(f"Could not read config file: {config_path}")
             return f"Error: Could not read config file: {config_path}"
 
-        # Write to main config file
-        with open(CLAUDE_CONFIG_FILE, "w") as f:
-            json.dump(new_config, f, indent=2)
+        # Write the profile via a temp file next to the real target so the
+        # swap is atomic. Resolving keeps a symlinked config linked, and the
+        # original permissions are kept since the file can hold MCP env secrets.
+        target = CLAUDE_CONFIG_FILE.resolve()
+        tmp_file = target.with_name(target.name + ".tmp")
+        try:
+            tmp_file.write_bytes(new_bytes)
+            if target.exists():
+                shutil.copymode(target, tmp_file)
+            os.replace(tmp_file, target)
+            _forget_stat(CLAUDE_CONFIG_FILE)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            raise
         logger.info(f"Config file updated: {CLAUDE_CONFIG_FILE}")
 
         # Restart Claude Desktop using separate commands for better reliability
@@ -312,18 +574,22 @@ To proceed, call `switch_mode(mode="{mode}", confirm=True)`"""
             # Quit Claude
             quit_result = subprocess.run(
                 ["osascript", "-e", 'quit app "Claude"'],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=10
             )
             if quit_result.returncode != 0:
                 logger.warning(f"osascript quit returned {quit_result.returncode}: {quit_result.stderr}")
 
-            # Brief pause then reopen (use Popen since we won't wait for this)
+            # Brief pause then reopen (use Popen since we won't wait for this).
+            # Run it in its own session so it outlives this server when Claude quits.
             subprocess.Popen(
-                ["bash", "-c", "sleep 1 && open -a 'Claude'"],
+                ["/bin/sh", "-c", "sleep 1 && open -a 'Claude'"],
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
             logger.info("Restart commands issued successfully")
         except subprocess.TimeoutExpired:
@@ -333,12 +599,7 @@ To proceed, call `switch_mode(mode="{mode}", confirm=True)`"""
 
         backup_msg = f"Backup saved: `{backup_name}`" if backup_name else "Warning: Backup failed"
 
-        return f"""✓ Switching to **{mode}** mode...
-
-{backup_msg}
-Config file updated. Claude Desktop is restarting.
-
-(This message may not be visible as the app is restarting)"""
+        return _SWITCH_OK_TMPL.format_map({"mode": mode, "backup_msg": backup_msg})
 
     except Exception as e:
         logger.error(f"Failed to switch mode: {e}", exc_info=True)
@@ -375,19 +636,30 @@ def save_current_as_mode(name: str, description: str = "", token_cost: str = "un
     if name in modes:
         return f"Error: Mode '{name}' already exists. Choose a different name."
 
-    # Read current config
-    current_config = load_json_file(CLAUDE_CONFIG_FILE)
-    if current_config is None:
+    # Read current config once; these bytes are both parsed for the reply and
+    # saved as the profile, so the two can't describe different configs
+    try:
+        config_bytes = CLAUDE_CONFIG_FILE.read_bytes()
+        current_config = _json_loads(config_bytes) if config_bytes else None
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not read {CLAUDE_CONFIG_FILE}: {e}")
+        current_config = None
+    if not isinstance(current_config, dict):
         return "Error: Could not read current Claude Desktop config"
 
     # Generate description if not provided
     if not description:
-        mcps = [k for k in current_config.get("mcpServers", {}).keys() if k != "mcp-mode-switcher"]
-        description = f"MCPs: {', '.join(mcps)}" if mcps else "No MCPs configured"
+        mcps_str = ", ".join(k for k in current_config.get("mcpServers", {}) if k != "mcp-mode-switcher")
+        description = f"MCPs: {mcps_str}" if mcps_str else "No MCPs configured"
 
-    # Save the config file
+    # Save the config file as a byte-exact copy of the live config
     config_path = get_mode_config_path(name)
-    if not save_json_file(config_path, current_config):
+    try:
+        CONFIGS_DIR.mkdir(parents=True, exist_ok=True)
+        config_path.write_bytes(config_bytes)
+        _forget_stat(config_path)
+    except OSError as e:
+        logger.error(f"Failed to write config to {config_path}: {e}")
         return f"Error: Failed to save config file: {config_path}"
 
     # Update modes.json
@@ -398,17 +670,13 @@ def save_current_as_mode(name: str, description: str = "", token_cost: str = "un
     if not save_modes(modes):
         return f"Warning: Config saved but failed to update modes.json"
 
-    # Get MCP list for confirmation
-    mcps = list(current_config.get("mcpServers", {}).keys())
-
-    return f"""✓ Saved current config as **{name}** mode!
-
-**Description**: {description}
-**Token cost**: {token_cost}
-**MCPs**: {', '.join(mcps)}
-**Config file**: `{config_path.name}`
-
-You can now switch to this mode anytime with `switch_mode("{name}")`"""
+    return _SAVE_OK_TMPL.format_map({
+        "name": name,
+        "description": description,
+        "token_cost": token_cost,
+        "mcps": ", ".join(current_config.get("mcpServers", {})),
+        "config_file": config_path.name,
+    })
 
 
 @mcp.tool()
@@ -419,26 +687,37 @@ def list_backups() -> str:
     They can be used to restore a previous configuration if needed.
     """
     logger.info("Tool called: list_backups()")
-    if not BACKUPS_DIR.exists():
-        return "No backups found. Backups are created automatically when switching modes."
-
-    backups = sorted(BACKUPS_DIR.glob("config.*.json"), reverse=True)
+    # Backup names embed a sortable timestamp, so only the names are needed.
+    # Matches glob("config.*.json"), which doesn't match plain "config.json".
+    try:
+        with os.scandir(BACKUPS_DIR) as it:
+            backups = [
+                e.name for e in it
+                if e.name.startswith("config.") and e.name.endswith(".json") and e.name != "config.json"
+            ]
+    except FileNotFoundError:
+        backups = []
+    except OSError as e:
+        logger.warning(f"Could not read backups directory {BACKUPS_DIR}: {e}")
+        backups = []
 
     if not backups:
         return "No backups found. Backups are created automatically when switching modes."
 
-    result = ["# Configuration Backups\n"]
-    result.append(f"Location: `{BACKUPS_DIR}`\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Configuration Backups\n")
+    w(f"\nLocation: `{BACKUPS_DIR}`\n")
 
-    for backup in backups[:10]:  # Show last 10
-        result.append(f"- `{backup.name}`")
+    for backup in heapq.nlargest(10, backups):  # Show last 10
+        w(f"\n- `{backup}`")
 
     if len(backups) > 10:
-        result.append(f"\n... and {len(backups) - 10} more")
+        w(f"\n\n... and {len(backups) - 10} more")
 
-    result.append("\nTo restore a backup, copy it to `claude_desktop_config.json` and restart Claude.")
+    w("\n\nTo restore a backup, copy it to `claude_desktop_config.json` and restart Claude.")
 
-    return "\n".join(result)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":